@@ -26,16 +26,18 @@ def main():
 
     # --- Data Preparation for LLM ---
     logger.info("Processing fetched subscriber updates...")
-    updates_text_block = ""
+    update_lines = []
     if subscriber_updates:
         for update in subscriber_updates:
             channel_name = update.get('channel_name', 'N/A')
             update_title = update.get('update_title', 'N/A')
             update_type = update.get('type', 'N/A')
-            update_line = f"- Channel: {channel_name}, Title: {update_title} (Type: {update_type})"
-            # Still print this to console for now as it's part of the "raw" output before summary
-            print(update_line)
-            updates_text_block += update_line + "\n"
+            update_lines.append(f"- Channel: {channel_name}, Title: {update_title} (Type: {update_type})")
+    # Join once instead of growing a string per update (avoids quadratic copying)
+    updates_text_block = "\n".join(update_lines) + ("\n" if update_lines else "")
+    if update_lines:
+        # Still print this to console for now as it's part of the "raw" output before summary
+        print(updates_text_block, end="")
 
     if not updates_text_block.strip():
         updates_text_block = "No new updates were found from your subscriptions to summarize."
@@ -0,0 +1,170 @@
+# tests/test_llm_handler.py
+import json
+from pathlib import Path
+
+import pytest
+
+from utils import llm_handler
+from utils.llm_handler import SummaryCache
+
+
+def _read_cache_file(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson and with the stdlib json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(llm_handler, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "data" / "llm_cache.json")
+
+
+@pytest.fixture
+def provider(monkeypatch, cache_path):
+    """Configure a fake model and provider, and point the module cache at tmp_path."""
+    calls = []
+
+    def fake_call_llm(text_to_summarize, llm_api_key):
+        calls.append(text_to_summarize)
+        return f"Real summary #{len(calls)}"
+
+    monkeypatch.setattr(llm_handler, "LLM_MODEL", "test/model")
+    monkeypatch.setattr(llm_handler, "_call_llm", fake_call_llm)
+    monkeypatch.setattr(llm_handler, "_summary_cache", SummaryCache(path=cache_path))
+    return calls
+
+
+def test_cache_hit_skips_llm_call(provider):
+    first = llm_handler.summarize_text_with_llm("some updates", "real-key")
+    second = llm_handler.summarize_text_with_llm("some updates", "real-key")
+
+    assert first == second == "Real summary #1"
+    assert len(provider) == 1
+
+
+@pytest.mark.parametrize("summary", ["cached", "Résumé: 新しい動画 🎬"])
+def test_cache_persists_across_instances(cache_path, json_backend, summary):
+    SummaryCache(path=cache_path).set("test/model", "some updates", summary)
+
+    assert SummaryCache(path=cache_path).get("test/model", "some updates") == summary
+
+
+def test_surrogate_summary_is_not_persisted(cache_path, json_backend):
+    SummaryCache(path=cache_path).set("test/model", "some updates", "bad \ud800 summary")
+
+    assert SummaryCache(path=cache_path).get("test/model", "some updates") is None
+
+
+def test_cache_key_includes_model(cache_path):
+    cache = SummaryCache(path=cache_path)
+    cache.set("model-a", "some updates", "from a")
+
+    assert cache.get("model-b", "some updates") is None
+
+
+def test_cache_key_accepts_lone_surrogates(cache_path):
+    cache = SummaryCache(path=cache_path)
+    cache.set("test/model", "bad \udc80 input", "summary")
+
+    assert cache.get("test/model", "bad \udc80 input") == "summary"
+    assert SummaryCache.make_key("test/model", "bad \udc80 input") != SummaryCache.make_key("test/model", "bad input")
+
+
+def test_expired_entry_is_ignored_and_not_persisted(cache_path, monkeypatch):
+    cache = SummaryCache(path=cache_path, ttl_seconds=60)
+    monkeypatch.setattr(llm_handler.time, "time", lambda: 1000.0)
+    cache.set("test/model", "old", "stale")
+    monkeypatch.setattr(llm_handler.time, "time", lambda: 1100.0)
+
+    assert cache.get("test/model", "old") is None
+
+    cache.set("test/model", "new", "fresh")
+    assert [entry["summary"] for entry in _read_cache_file(cache_path).values()] == ["fresh"]
+
+
+def test_expired_entries_dropped_on_load(cache_path, monkeypatch):
+    monkeypatch.setattr(llm_handler.time, "time", lambda: 1000.0)
+    SummaryCache(path=cache_path, ttl_seconds=60).set("test/model", "old", "stale")
+    monkeypatch.setattr(llm_handler.time, "time", lambda: 1100.0)
+
+    cache = SummaryCache(path=cache_path, ttl_seconds=60)
+    cache.set("test/model", "new", "fresh")
+    assert [entry["summary"] for entry in _read_cache_file(cache_path).values()] == ["fresh"]
+
+
+def test_use_cache_false_bypasses_cache(provider, cache_path):
+    llm_handler.summarize_text_with_llm("some updates", "real-key", use_cache=False)
+    llm_handler.summarize_text_with_llm("some updates", "real-key", use_cache=False)
+
+    assert len(provider) == 2
+    assert SummaryCache(path=cache_path).get("test/model", "some updates") is None
+    assert not Path(cache_path).exists()
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"{not json", b"[1, 2]", b'{"k": "not an entry"}', b"[" * 200000],
+    ids=["invalid-json", "not-a-dict", "not-an-entry", "deeply-nested"],
+)
+def test_corrupt_cache_file_is_ignored(provider, cache_path, contents, json_backend, monkeypatch):
+    path = Path(cache_path)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(contents)
+    monkeypatch.setattr(llm_handler, "_summary_cache", SummaryCache(path=cache_path))
+
+    assert llm_handler.summarize_text_with_llm("hello", "real-key") == "Real summary #1"
+
+
+def test_cache_errors_do_not_fail_the_summary(provider, monkeypatch):
+    class BrokenCache:
+        def get(self, model, text):
+            raise RuntimeError("lookup broke")
+
+        def set(self, model, text, summary):
+            raise RuntimeError("store broke")
+
+    monkeypatch.setattr(llm_handler, "_summary_cache", BrokenCache())
+
+    assert llm_handler.summarize_text_with_llm("some updates", "real-key") == "Real summary #1"
+
+
+def test_unserializable_entry_is_rolled_back(cache_path, json_backend):
+    cache = SummaryCache(path=cache_path)
+    cache.set("test/model", "first", "bad \ud800 summary")
+    cache.set("test/model", "second", "Real good summary")
+
+    assert cache.get("test/model", "first") is None
+    assert SummaryCache(path=cache_path).get("test/model", "second") == "Real good summary"
+
+
+def test_unserializable_summary_is_still_returned(provider, json_backend, monkeypatch):
+    monkeypatch.setattr(llm_handler, "_call_llm", lambda text, key: "x \ud800")
+
+    assert llm_handler.summarize_text_with_llm("some updates", "real-key") == "x \ud800"
+
+
+def test_placeholder_summary_is_not_cached(monkeypatch, cache_path):
+    monkeypatch.setattr(llm_handler, "LLM_MODEL", "test/model")
+    monkeypatch.setattr(llm_handler, "_summary_cache", SummaryCache(path=cache_path))
+
+    summary = llm_handler.summarize_text_with_llm("some updates", "YOUR_PLACEHOLDER_LLM_API_KEY")
+
+    assert summary.startswith("This is a placeholder summary")
+    assert SummaryCache(path=cache_path).get("test/model", "some updates") is None
+    assert not Path(cache_path).exists()
+
+
+def test_placeholder_preview_is_single_line():
+    summary = llm_handler.summarize_text_with_llm("- Channel: A, Title: One\n- Channel: B, Title: Two\n")
+
+    assert "\n" not in summary
+    assert "started with: '- Channel: A, Title: One - Channel: B, Title: Two...'" in summary
@@ -1,5 +1,15 @@
 # utils/llm_handler.py
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import time
+
+try:
+    import orjson  # Optional: faster JSON serialization for the summary cache
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -7,7 +17,155 @@ logger = logging.getLogger(__name__)
 # TODO: Implement API call to the chosen LLM
 # TODO: Securely store LLM API key
 
-def summarize_text_with_llm(text_to_summarize, llm_api_key=None):
+# Provider/model identifier (e.g. "openai/gpt-4o-mini"). None until a provider is integrated.
+# NOTE: While this is None the summary cache below is dormant: nothing is looked up or stored.
+LLM_MODEL = None
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_FILE_PATH = os.path.join(PROJECT_ROOT, "data", "llm_cache.json")
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class SummaryCache:
+    """Exact-match cache of generated summaries, persisted to a JSON file.
+
+    Entries are keyed by a BLAKE2b hash of the model identifier and the text
+    sent for summarization, so re-running the report on unchanged updates
+    skips the LLM call.
+
+    Dormant for now: summarize_text_with_llm only uses it once LLM_MODEL is
+    set and _call_llm returns real provider output. Placeholder summaries are
+    never cached.
+    """
+
+    def __init__(self, path=CACHE_FILE_PATH, ttl_seconds=CACHE_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries = self._load()
+
+    @staticmethod
+    def make_key(model, text):
+        # surrogatepass: lone surrogates (e.g. from bad captions) must not make keying raise
+        return hashlib.blake2b(f"{model}\n{text}".encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+    def get(self, model, text):
+        key = self.make_key(model, text)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            logger.debug("Cached summary expired, dropping it.")
+            del self._entries[key]
+            return None
+        return entry.get("summary")
+
+    def set(self, model, text, summary):
+        key = self.make_key(model, text)
+        previous = self._entries.get(key)
+        self._entries[key] = {"summary": summary, "timestamp": time.time()}
+        if not self._save():
+            # Roll back so an unsaved entry is neither served from memory nor breaks later saves
+            if previous is None:
+                del self._entries[key]
+            else:
+                self._entries[key] = previous
+
+    def _is_expired(self, entry):
+        return time.time() - entry.get("timestamp", 0) > self.ttl_seconds
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            entries = orjson.loads(data) if orjson else json.loads(data)
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError; keep catching ValueError.
+        # The stdlib parser raises RecursionError on deeply nested input instead.
+        except (OSError, ValueError, RecursionError) as e:
+            logger.warning(f"Could not read LLM cache file {self.path}, starting with an empty cache: {e}")
+            return {}
+        if not isinstance(entries, dict):
+            logger.warning(f"LLM cache file {self.path} is not a JSON object, starting with an empty cache.")
+            return {}
+        # Drop malformed and expired entries so they are not rewritten on the next save
+        entries = {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict) and isinstance(entry.get("timestamp"), (int, float))
+            and not self._is_expired(entry)
+        }
+        logger.debug(f"Loaded {len(entries)} cached summaries from {self.path}.")
+        return entries
+
+    def _save(self):
+        """Write all entries to the cache file. Returns False if they could not be written."""
+        try:
+            if orjson:
+                data = orjson.dumps(self._entries)
+            else:
+                # Strict UTF-8 encoding rejects lone surrogates like orjson does, so both backends
+                # write (and can read back) the same files.
+                data = json.dumps(self._entries, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not serialize LLM cache entries: {e}")
+            return False
+        cache_dir = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temp file and swap it in, so an interrupted write can't corrupt the cache
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache file {self.path}: {e}")
+            return False
+        return True
+
+
+_summary_cache = None
+
+
+def _get_summary_cache():
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = SummaryCache()
+    return _summary_cache
+
+
+def _cache_lookup(text_to_summarize):
+    """Return a cached summary, or None. Cache failures count as a miss and never fail the summary."""
+    try:
+        return _get_summary_cache().get(LLM_MODEL, text_to_summarize)
+    except Exception as e:
+        logger.warning(f"LLM cache lookup failed, treating it as a miss: {e}")
+        return None
+
+
+def _cache_store(text_to_summarize, summary):
+    """Store a summary in the cache. Failures are logged and the write is skipped."""
+    try:
+        _get_summary_cache().set(LLM_MODEL, text_to_summarize, summary)
+    except Exception as e:
+        logger.warning(f"LLM cache write failed, skipping it: {e}")
+
+
+def _preview(text, length=50):
+    """Return the first `length` characters of text on a single line, for logs and placeholder output."""
+    return " ".join(text[:length].split())
+
+
+def _call_llm(text_to_summarize, llm_api_key):
+    """Summarize text with the configured provider. Returns None while no provider is integrated."""
+    # TODO: Actual LLM API call logic will go here.
+    return None
+
+
+def summarize_text_with_llm(text_to_summarize, llm_api_key=None, use_cache=True):
     logger.info("Attempting to summarize text with LLM...")
 
     if not text_to_summarize:
@@ -15,16 +173,30 @@ def summarize_text_with_llm(text_to_summarize, llm_api_key=None):
         return "Error: No text provided for summarization."
 
     try:
-        # TODO: Actual LLM API call logic will go here.
         if llm_api_key and llm_api_key.startswith("YOUR_PLACEHOLDER"):
             logger.warning("Using a placeholder API key for LLM.")
         elif not llm_api_key:
             logger.info("No LLM API key provided, returning placeholder summary.")
 
+        # Only real provider output is cached, and only when a model is configured to key it by
+        use_cache = use_cache and LLM_MODEL is not None
+        if use_cache:
+            cached_summary = _cache_lookup(text_to_summarize)
+            if cached_summary is not None:
+                logger.info("Returning cached summary; skipping LLM call.")
+                return cached_summary
+
+        summary = _call_llm(text_to_summarize, llm_api_key)
+        if summary is not None:
+            logger.info("LLM summarization complete.")
+            if use_cache:
+                _cache_store(text_to_summarize, summary)
+            return summary
+
         logger.debug("Simulating LLM API call...")
 
-        # Placeholder summary
-        summary = f"This is a placeholder summary for the provided text which started with: '{text_to_summarize[:50]}...'"
+        # Placeholder summary (never cached)
+        summary = f"This is a placeholder summary for the provided text which started with: '{_preview(text_to_summarize)}...'"
         logger.info("LLM summarization complete (placeholder).")
         return summary
     except Exception as e: